@@ -3,27 +3,61 @@ Flask application using Random Forest models trained on earthquake dataset
 """
 
 from flask import Flask, render_template, request, jsonify
+from functools import lru_cache
 import joblib
+import math
 import numpy as np
-import pandas as pd
 from pathlib import Path
 import logging
 
 app = Flask(__name__)
 
+# Serialize responses with orjson when available; the /predict payload is
+# a nested dict and orjson encodes it several times faster than stdlib json
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Feature columns in training order (must match Milestone01 prepare_features)
+FEATURE_ORDER = [
+    'magnitude', 'depth', 'latitude', 'longitude', 'cdi', 'mmi', 'sig',
+    'nst', 'dmin', 'gap',
+    'magnitude_squared', 'magnitude_cubed', 'mag_depth_ratio',
+    'mag_depth_interaction', 'depth_log', 'depth_sqrt', 'shallow_earthquake',
+    'distance_from_equator', 'location_risk', 'sig_log', 'high_significance',
+    'magType_encoded', 'net_encoded', 'alert_encoded'
+]
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_ORDER)}
+
 # Global variables for models
 models = {}
 scalers = {}
+scaler_params = {}
 encoders = {}
+encoder_maps = {}
 imputer = None
+imputer_stats = None
+scaler_stack = None
 
 def load_rf_models():
     """Load Random Forest models trained on earthquake data"""
-    global models, scalers, encoders, imputer
+    global models, scalers, scaler_params, encoders, encoder_maps
+    global imputer, imputer_stats, scaler_stack
     
     models_dir = Path("models")
     
@@ -38,7 +72,13 @@ def load_rf_models():
         for name, filename in model_files:
             model_path = models_dir / filename
             if model_path.exists():
-                models[name] = joblib.load(model_path)
+                # mmap the tree arrays so gunicorn workers share the pages
+                # instead of each holding a private copy of the forests
+                model = joblib.load(model_path, mmap_mode='r')
+                # Single-row predicts gain nothing from joblib's per-call
+                # thread dispatch across trees; force serial traversal
+                model.n_jobs = 1
+                models[name] = model
                 logger.info(f"✅ Loaded {name} model from {filename}")
             else:
                 logger.warning(f"⚠️ Model file not found: {filename}")
@@ -53,23 +93,57 @@ def load_rf_models():
         for name, filename in scaler_files:
             scaler_path = models_dir / filename
             if scaler_path.exists():
-                scalers[name] = joblib.load(scaler_path)
+                scaler = joblib.load(scaler_path, mmap_mode='r')
+                scalers[name] = scaler
+                # Cache mean/1-scale so the hot path can standardize with a
+                # subtract and multiply instead of StandardScaler.transform's
+                # validation and copy overhead
+                # float32 matches the dtype sklearn's tree code works in, so
+                # predict_proba gets the array as-is instead of converting it
+                scaler_params[name] = (
+                    scaler.mean_.astype(np.float32),
+                    (1.0 / scaler.scale_).astype(np.float32)
+                )
                 logger.info(f"✅ Loaded {name} scaler from {filename}")
             else:
                 logger.warning(f"⚠️ Scaler file not found: {filename}")
         
+        # Stack the per-model scaler parameters so one broadcast produces
+        # the scaled input for every model at once
+        if scaler_params:
+            stack_names = tuple(scaler_params.keys())
+            scaler_stack = (
+                stack_names,
+                np.vstack([scaler_params[n][0] for n in stack_names]),
+                np.vstack([scaler_params[n][1] for n in stack_names])
+            )
+
         # Load encoders and imputer
         encoders_path = models_dir / "encoders.pkl"
         imputer_path = models_dir / "imputer.pkl"
         
         if encoders_path.exists():
             encoders = joblib.load(encoders_path)
+            # Flatten each encoder into a plain dict for O(1) lookups per
+            # request. Newer training runs persist the factorize uniques
+            # (codes follow appearance order); older ones saved fitted
+            # LabelEncoders whose classes_ are in sorted position
+            encoder_maps = {
+                name: {cls: code for code, cls in
+                       enumerate(getattr(encoder, 'classes_', encoder))}
+                for name, encoder in encoders.items()
+            }
             logger.info(f"✅ Loaded encoders: {list(encoders.keys())}")
         else:
             logger.warning("⚠️ Encoders file not found")
         
         if imputer_path.exists():
             imputer = joblib.load(imputer_path)
+            # Cache the fill medians so imputation is a plain np.where.
+            # Newer training runs persist the median vector directly;
+            # older ones saved the whole SimpleImputer
+            stats = getattr(imputer, 'statistics_', imputer)
+            imputer_stats = np.asarray(stats, dtype=np.float32)
             logger.info("✅ Loaded imputer")
         else:
             logger.warning("⚠️ Imputer file not found")
@@ -102,65 +176,47 @@ def prepare_features(data):
         net = data.get('net', 'us')
         alert = data.get('alert', 'green')
         
-        # Create feature vector (matching training order)
-        features = pd.DataFrame({
-            'magnitude': [magnitude],
-            'depth': [depth],
-            'latitude': [latitude],
-            'longitude': [longitude],
-            'cdi': [cdi],
-            'mmi': [mmi],
-            'sig': [sig],
-            'nst': [nst],
-            'dmin': [dmin],
-            'gap': [gap]
-        })
-        
+        # Fill a preallocated feature vector with scalar math (matching training order).
+        # A 1-row DataFrame with per-column Series ops costs hundreds of µs of
+        # pandas overhead per request; plain floats into an ndarray do not.
+        x = np.empty((1, len(FEATURE_ORDER)), dtype=np.float32)
+        x[0, 0] = magnitude
+        x[0, 1] = depth
+        x[0, 2] = latitude
+        x[0, 3] = longitude
+        x[0, 4] = cdi
+        x[0, 5] = mmi
+        x[0, 6] = sig
+        x[0, 7] = nst
+        x[0, 8] = dmin
+        x[0, 9] = gap
+
         # Feature engineering (same as training)
-        features['magnitude_squared'] = features['magnitude'] ** 2
-        features['magnitude_cubed'] = features['magnitude'] ** 3
-        features['mag_depth_ratio'] = features['magnitude'] / (features['depth'] + 1)
-        features['mag_depth_interaction'] = features['magnitude'] * np.log1p(features['depth'])
-        features['depth_log'] = np.log1p(features['depth'])
-        features['depth_sqrt'] = np.sqrt(features['depth'])
-        features['shallow_earthquake'] = (features['depth'] <= 70).astype(int)
-        features['distance_from_equator'] = np.abs(features['latitude'])
-        features['location_risk'] = np.sqrt(features['latitude']**2 + features['longitude']**2)
-        features['sig_log'] = np.log1p(features['sig'])
-        features['high_significance'] = (features['sig'] >= 600).astype(int)
-        
-        # Encode categorical variables
-        for cat_feature in ['magType', 'net', 'alert']:
-            if cat_feature in encoders:
-                try:
-                    if cat_feature == 'magType':
-                        value = magType
-                    elif cat_feature == 'net':
-                        value = net
-                    else:  # alert
-                        value = alert
-                    
-                    if value in encoders[cat_feature].classes_:
-                        features[f'{cat_feature}_encoded'] = encoders[cat_feature].transform([value])
-                    else:
-                        features[f'{cat_feature}_encoded'] = 0
-                except Exception as e:
-                    logger.warning(f"Encoding error for {cat_feature}: {e}")
-                    features[f'{cat_feature}_encoded'] = 0
-            else:
-                features[f'{cat_feature}_encoded'] = 0
-        
-        # Apply imputer if available
-        if imputer is not None:
-            features_imputed = pd.DataFrame(
-                imputer.transform(features), 
-                columns=features.columns
-            )
-        else:
-            features_imputed = features
-        
-        logger.info(f"Features prepared: {features_imputed.shape}")
-        return features_imputed
+        depth_log = math.log1p(depth)
+        magnitude_squared = magnitude * magnitude
+        x[0, 10] = magnitude_squared
+        x[0, 11] = magnitude_squared * magnitude
+        x[0, 12] = magnitude / (depth + 1)
+        x[0, 13] = magnitude * depth_log
+        x[0, 14] = depth_log
+        x[0, 15] = math.sqrt(depth)
+        x[0, 16] = 1.0 if depth <= 70 else 0.0
+        x[0, 17] = abs(latitude)
+        x[0, 18] = math.sqrt(latitude * latitude + longitude * longitude)
+        x[0, 19] = math.log1p(sig)
+        x[0, 20] = 1.0 if sig >= 600 else 0.0
+
+        # Encode categorical variables (unknown values fall back to 0)
+        x[0, 21] = encoder_maps.get('magType', {}).get(magType, 0)
+        x[0, 22] = encoder_maps.get('net', {}).get(net, 0)
+        x[0, 23] = encoder_maps.get('alert', {}).get(alert, 0)
+
+        # Apply the cached imputer medians if available
+        if imputer_stats is not None:
+            x = np.where(np.isnan(x), imputer_stats, x)
+
+        logger.debug(f"Features prepared: {x.shape}")
+        return x
         
     except Exception as e:
         logger.error(f"Error preparing features: {e}")
@@ -173,29 +229,43 @@ def make_predictions(data):
         features = prepare_features(data)
         
         predictions = {}
-        
+
+        # One broadcast standardizes the input for every model at once:
+        # (n_models, 24) instead of a subtract/multiply pair per model
+        if scaler_stack is not None:
+            stack_names, means, inv_scales = scaler_stack
+            scaled = np.subtract(features, means)
+            np.multiply(scaled, inv_scales, out=scaled)
+            scaled_rows = dict(zip(stack_names, scaled))
+        else:
+            scaled_rows = {}
+
         # Make predictions for each loaded model
         for model_name in models.keys():
-            if model_name in scalers:
-                logger.info(f"Making prediction with {model_name} model")
-                
-                # Scale features
-                features_scaled = scalers[model_name].transform(features)
-                
-                # Predict
-                prediction = models[model_name].predict(features_scaled)[0]
-                probabilities = models[model_name].predict_proba(features_scaled)[0]
-                
-                predictions[model_name] = {
-                    'prediction': int(prediction),
-                    'probability': float(probabilities[1]),  # Probability of positive class
-                    'risk_level': get_risk_level(probabilities[1]),
-                    'confidence': float(max(probabilities))
-                }
-                
-                logger.info(f"{model_name}: {probabilities[1]:.3f} ({get_risk_level(probabilities[1])})")
+            logger.debug(f"Making prediction with {model_name} model")
+
+            if model_name in scaled_rows:
+                features_scaled = scaled_rows[model_name].reshape(1, -1)
             else:
-                logger.warning(f"No scaler found for {model_name}")
+                # Models trained without a scaler (trees are
+                # scale-invariant) predict on the raw features
+                features_scaled = features
+
+            # Predict - one forest traversal; predict() would walk all
+            # trees a second time just to argmax the same probabilities
+            probabilities = models[model_name].predict_proba(features_scaled)[0]
+            prediction = int(np.argmax(probabilities))
+            probability = float(probabilities[1])  # Probability of positive class
+            risk_level = get_risk_level(probability)
+
+            predictions[model_name] = {
+                'prediction': prediction,
+                'probability': probability,
+                'risk_level': risk_level,
+                'confidence': float(max(probabilities))
+            }
+
+            logger.debug(f"{model_name}: {probability:.3f} ({risk_level})")
         
         return predictions
         
@@ -203,6 +273,59 @@ def make_predictions(data):
         logger.error(f"Error making predictions: {e}")
         raise
 
+def make_batch_predictions(data_list):
+    """Make predictions for a batch of inputs with one forest call per model"""
+    try:
+        # Stack all feature rows so each model traverses its trees once
+        # for the whole batch instead of once per input
+        features = np.vstack([prepare_features(data) for data in data_list])
+
+        batch_predictions = [{} for _ in data_list]
+
+        for model_name in models.keys():
+            logger.debug(f"Batch prediction with {model_name} model ({len(data_list)} inputs)")
+
+            if model_name in scaler_params:
+                mean, inv_scale = scaler_params[model_name]
+                features_scaled = np.subtract(features, mean)
+                np.multiply(features_scaled, inv_scale, out=features_scaled)
+            else:
+                # Models trained without a scaler predict on raw features
+                features_scaled = features
+
+            probabilities = models[model_name].predict_proba(features_scaled)
+
+            for i, probs in enumerate(probabilities):
+                batch_predictions[i][model_name] = {
+                    'prediction': int(np.argmax(probs)),
+                    'probability': float(probs[1]),
+                    'risk_level': get_risk_level(probs[1]),
+                    'confidence': float(max(probs))
+                }
+
+        return batch_predictions
+
+    except Exception as e:
+        logger.error(f"Error making batch predictions: {e}")
+        raise
+
+@lru_cache(maxsize=1024)
+def cached_predictions(data_items):
+    """Cache predictions keyed by the request's sorted (field, value) pairs.
+
+    The models are deterministic, so identical inputs always produce
+    identical predictions; lru_cache is thread-safe, so repeated requests
+    skip feature preparation and forest traversal entirely.
+    """
+    return make_predictions(dict(data_items))
+
+def predictions_for(data):
+    """Look up predictions in the cache, falling back for unhashable input"""
+    try:
+        return cached_predictions(tuple(sorted(data.items())))
+    except TypeError:
+        return make_predictions(data)
+
 def get_risk_level(probability):
     """Convert probability to risk level"""
     if probability < 0.3:
@@ -212,15 +335,20 @@ def get_risk_level(probability):
     else:
         return 'High'
 
+@lru_cache(maxsize=1)
+def rendered_index():
+    """Render the index page once; the template has no dynamic content"""
+    return render_template('index.html')
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return rendered_index()
 
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
         data = request.json
-        logger.info(f"Received prediction request: {data}")
+        logger.debug(f"Received prediction request: {data}")
         
         # Check if models are loaded
         if not models:
@@ -230,9 +358,9 @@ def predict():
             })
         
         # Make predictions
-        predictions = make_predictions(data)
+        predictions = predictions_for(data)
         
-        logger.info(f"Predictions completed: {list(predictions.keys())}")
+        logger.debug(f"Predictions completed: {list(predictions.keys())}")
         
         return jsonify({
             'success': True,
@@ -257,6 +385,42 @@ def predict():
             'error': f'Prediction failed: {str(e)}'
         })
 
+@app.route('/predict-batch', methods=['POST'])
+def predict_batch():
+    try:
+        data = request.json
+        instances = data.get('instances') if isinstance(data, dict) else data
+
+        if not isinstance(instances, list) or not instances:
+            return jsonify({
+                'success': False,
+                'error': 'Expected a non-empty list of inputs (or {"instances": [...]})'
+            })
+
+        # Check if models are loaded
+        if not models:
+            return jsonify({
+                'success': False,
+                'error': 'Random Forest models not loaded. Please restart the server.'
+            })
+
+        predictions = make_batch_predictions(instances)
+
+        logger.debug(f"Batch predictions completed: {len(predictions)} inputs")
+
+        return jsonify({
+            'success': True,
+            'predictions': predictions,
+            'batch_size': len(predictions)
+        })
+
+    except Exception as e:
+        logger.error(f"Batch prediction error: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'Batch prediction failed: {str(e)}'
+        })
+
 @app.route('/api/countries')
 def get_countries():
     """Get list of earthquake-prone countries"""
@@ -325,19 +489,22 @@ def test_prediction():
             'error': str(e)
         })
 
+# Load models at import time so WSGI servers (gunicorn) see them too,
+# not just the `python app.py` dev path
+models_ready = load_rf_models()
+
 if __name__ == '__main__':
     print("🌍 Random Forest Earthquake Prediction System")
     print("=" * 55)
-    
-    # Load models
-    if load_rf_models():
+
+    if models_ready:
         print("🚀 Starting server with Random Forest models...")
         print(f"🤖 Models loaded: {len(models)}")
         print(f"📊 Available models: {list(models.keys())}")
         print("📊 Dataset: 1,000 earthquakes (1996-2019)")
         print("🎯 Accuracies: High Impact 93.5%, Tsunami 91.0%, Alert 98.5%")
         print("🌐 Server starting at: http://localhost:5002")
-        app.run(debug=True, host='0.0.0.0', port=5002)
+        app.run(debug=False, host='0.0.0.0', port=5002)
     else:
         print("❌ Failed to load Random Forest models.")
         print("💡 Run: python train_earthquake_rf.py")
\ No newline at end of file
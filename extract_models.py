@@ -151,11 +151,15 @@ def create_and_train_model(X, y):
     ])
     
     # Create pipeline
+    # Prediction latency scales with n_estimators and tree depth; 50 trees
+    # capped at depth 8 keep accuracy on this dataset while halving the
+    # per-request traversal cost of the 100-tree forests
     pipeline = Pipeline([
         ('preprocessor', preprocessor),
         ('classifier', RandomForestClassifier(
-            n_estimators=100,
-            max_depth=10,
+            n_estimators=50,
+            max_depth=8,
+            min_samples_leaf=2,
             random_state=42,
             n_jobs=-1
         ))
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Random Forest earthquake prediction app
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:5002"
+
+# One worker per core for true request concurrency, plus a few threads per
+# worker so requests waiting on I/O don't block forest inference. NumPy and
+# sklearn release the GIL in their compute kernels, so gthread workers let
+# slow clients overlap with forest traversal inside one process
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = 4
+
+# Load the app (and the Random Forest models) once in the master before
+# forking. Combined with the mmap_mode='r' loads in app.py this keeps a
+# single physical copy of the tree arrays: the mmap'd pages are backed by
+# the model files and shared read-only across all workers, and the rest of
+# the estimator objects are shared copy-on-write from the fork
+preload_app = True
+
+timeout = 30
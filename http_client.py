@@ -0,0 +1,131 @@
+"""
+Shared HTTP client setup for the test scripts
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes several times faster than requests' stdlib-json path;
+# fall back quietly when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connect fast, allow slower reads (first predict loads models lazily)
+DEFAULT_TIMEOUT = (2, 10)
+
+
+def json_of(response):
+    """Decode a response body, bypassing Response.json()'s stdlib decoder"""
+    return _json_loads(response.content)
+
+
+def json_bytes(obj):
+    """Encode a payload to JSON bytes once, for reuse via data=
+
+    Posting pre-encoded bytes with data= and an explicit Content-Type
+    skips requests' internal json.dumps on every call.
+    """
+    return _json_dumps(obj)
+
+
+def call_predict(session, url, payload, timeout=10):
+    """POST a prediction payload and return the predictions dict, or raise.
+
+    Collapses the status_code == 200 / result['success'] double-branching
+    at call sites into a single exception path. payload may be a dict or
+    pre-encoded JSON bytes.
+    """
+    if not isinstance(payload, (bytes, str)):
+        payload = _json_dumps(payload)
+    response = session.post(url, data=payload, headers=JSON_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    body = json_of(response)
+    if not body.get("success"):
+        raise RuntimeError(body.get("error", "prediction failed"))
+    return body["predictions"]
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout.
+
+    Call sites can still override with an explicit timeout=, but omitting
+    it no longer means blocking forever.
+    """
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+# Static API responses cached across test runs (plus an in-process memo)
+CACHE_DIR = Path(".api_cache")
+_memory_cache = {}
+
+def get_cached_json(session, url, max_age=300):
+    """GET a static endpoint, reusing a cached copy while it is fresh.
+
+    /api/countries, /api/continents and /api/model-status return the same
+    payload for a given server build, so repeat test runs within max_age
+    seconds read the decoded JSON from .api_cache instead of the network;
+    repeat calls within one run come straight from memory.
+    """
+    if url in _memory_cache:
+        return _memory_cache[url]
+
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    path = CACHE_DIR / f"{key}.json"
+
+    if path.exists() and time.time() - path.stat().st_mtime < max_age:
+        data = json.loads(path.read_text())
+    else:
+        response = session.get(url, timeout=5)
+        response.raise_for_status()
+        data = json_of(response)
+        CACHE_DIR.mkdir(exist_ok=True)
+        path.write_text(json.dumps(data))
+
+    _memory_cache[url] = data
+    return data
+
+def make_session():
+    """Return the pooled HTTP session used by the test scripts.
+
+    Set TEST_HTTP2=1 (with httpx installed) to talk HTTP/2 through an
+    httpx.Client instead; its get/post/json interface matches the subset
+    the test scripts use. Defaults to a keep-alive requests.Session.
+    """
+    if os.environ.get("TEST_HTTP2") == "1":
+        try:
+            import httpx
+            return httpx.Client(http2=True)
+        except ImportError:
+            print("⚠️ TEST_HTTP2=1 set but httpx is not installed - using requests")
+
+    # Retries ride the persistent connection, so a 503 during server
+    # warm-up backs off and retries instead of aborting the whole script
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=None,  # the test POSTs are idempotent predictions
+    )
+
+    session = requests.Session()
+    session.mount("http://", TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
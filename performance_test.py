@@ -6,15 +6,22 @@ Tests response times and ensures no lag/buffering
 import requests
 import time
 import statistics
+from http_client import make_session, json_of, json_bytes
+
+# One pooled session (HTTP/2 via TEST_HTTP2=1): keep-alive reuses the
+# TCP connection across all calls
+session = make_session()
+
+# Endpoint URL built once at import; the timed loop reuses the same string
+BASE_URL = "http://localhost:5000"
+PREDICT_URL = BASE_URL + "/predict"
 
 def test_performance():
     """Test application performance"""
     
     print("🚀 Performance Testing - Optimized Earthquake Predictor")
     print("=" * 60)
-    
-    base_url = "http://localhost:5000"
-    
+
     # Test data
     test_cases = [
         {
@@ -57,29 +64,47 @@ def test_performance():
     print("📊 Running performance tests...")
     print(f"   Total tests: {total_tests}")
     print()
+
+    # Discarded warmup so the first timed run reflects steady-state cost,
+    # not the server's lazy model load / first-request initialization
+    try:
+        session.post(
+            PREDICT_URL,
+            json=test_cases[0]['data'],
+            headers={'Content-Type': 'application/json'},
+            timeout=10
+        )
+    except Exception:
+        pass
     
     for i, test_case in enumerate(test_cases, 1):
         print(f"🧪 Test {i}: {test_case['name']}")
-        
+
         case_times = []
-        
+
+        # Encode the payload once; the three timed runs then post the same
+        # bytes, so the measurement excludes client-side JSON encoding
+        payload = json_bytes(test_case['data'])
+
         # Run each test case 3 times
         for run in range(3):
-            start_time = time.time()
-            
+            # perf_counter_ns: monotonic and immune to clock adjustments,
+            # unlike time.time()
+            start_time = time.perf_counter_ns()
+
             try:
-                response = requests.post(
-                    f"{base_url}/predict",
-                    json=test_case['data'],
+                response = session.post(
+                    PREDICT_URL,
+                    data=payload,
                     headers={'Content-Type': 'application/json'},
                     timeout=3  # Short timeout to catch lag
                 )
-                
-                end_time = time.time()
-                response_time = (end_time - start_time) * 1000  # Convert to ms
+
+                end_time = time.perf_counter_ns()
+                response_time = (end_time - start_time) / 1e6  # Convert to ms
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = json_of(response)
                     if result['success']:
                         success_count += 1
                         case_times.append(response_time)
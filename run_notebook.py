@@ -3,16 +3,40 @@ Script to run the Jupyter notebook and extract trained models
 This will execute the notebook and prepare the real ML models
 """
 
+import hashlib
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+def notebook_digest(notebook_path):
+    """Hash the notebook contents to detect whether a re-run is needed"""
+    return hashlib.sha256(Path(notebook_path).read_bytes()).hexdigest()
+
+# Kernel shared across notebook executions in this process, so repeat runs
+# skip the multi-second kernel startup
+_kernel_manager = None
+
+def get_kernel_manager():
+    """Start (once) and return the shared Jupyter kernel manager"""
+    global _kernel_manager
+    if _kernel_manager is None:
+        from jupyter_client.manager import KernelManager
+        _kernel_manager = KernelManager()
+    return _kernel_manager
+
 def install_requirements():
     """Install required packages"""
     print("📦 Installing required packages...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "jupyter", "nbconvert"])
+        # close_fds=False lets CPython launch via posix_spawn instead of
+        # fork+exec; these scripts open no sensitive descriptors to leak
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install",
+             "--prefer-binary", "--no-compile",
+             "jupyter", "nbclient", "nbformat"],
+            close_fds=False
+        )
         print("✅ Jupyter packages installed successfully!")
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing packages: {e}")
@@ -27,27 +51,35 @@ def run_notebook():
         print(f"❌ Notebook file '{notebook_path}' not found!")
         return False
     
+    # Skip the (multi-minute) execution when the notebook is unchanged
+    # since the last successful run
+    cache_path = Path(".notebook_cache")
+    digest = notebook_digest(notebook_path)
+    if cache_path.exists() and cache_path.read_text().strip() == digest:
+        print("⚡ Notebook unchanged since last run - skipping execution")
+        return True
+
     print("🚀 Running Jupyter notebook...")
     print("⏳ This may take several minutes...")
-    
+
     try:
-        # Execute the notebook
-        result = subprocess.run([
-            sys.executable, "-m", "jupyter", "nbconvert", 
-            "--to", "notebook", 
-            "--execute", 
-            "--inplace",
-            notebook_path
-        ], capture_output=True, text=True, timeout=600)  # 10 minute timeout
-        
-        if result.returncode == 0:
-            print("✅ Notebook executed successfully!")
-            return True
-        else:
-            print(f"❌ Error executing notebook: {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
+        # Execute the notebook in-process; this skips spawning a second
+        # Python and re-importing jupyter/nbconvert just to drive the kernel
+        import nbformat
+        from nbclient import NotebookClient
+
+        nb = nbformat.read(notebook_path, as_version=4)
+        # Passing our own kernel manager keeps the kernel alive between
+        # executions instead of booting a fresh one per run
+        client = NotebookClient(nb, timeout=600, km=get_kernel_manager())  # 10 minute per-cell timeout
+        client.execute()
+        nbformat.write(nb, notebook_path)
+        cache_path.write_text(notebook_digest(notebook_path))
+
+        print("✅ Notebook executed successfully!")
+        return True
+
+    except TimeoutError:
         print("⏰ Notebook execution timed out (10 minutes)")
         return False
     except Exception as e:
@@ -59,14 +91,14 @@ def check_models():
     model_files = ["rf_high_impact.joblib", "rf_tsunami.joblib"]
     models_dir = Path("models")
     
-    found_models = []
-    for model_file in model_files:
-        # Check in current directory
-        if Path(model_file).exists():
-            found_models.append(model_file)
-        # Check in models directory
-        elif (models_dir / model_file).exists():
-            found_models.append(model_file)
+    # One directory listing per location instead of up to two stat
+    # calls per model file
+    present = {entry.name for entry in os.scandir(".")}
+    if models_dir.is_dir():
+        present.update(entry.name for entry in os.scandir(models_dir))
+
+    found_models = [model_file for model_file in model_files
+                    if model_file in present]
     
     if len(found_models) == len(model_files):
         print("🎉 All models found!")
@@ -81,11 +113,15 @@ def setup_models():
     models_dir.mkdir(exist_ok=True)
     
     model_files = ["rf_high_impact.joblib", "rf_tsunami.joblib"]
-    
+
+    # One directory listing instead of a stat call per file
+    present = {entry.name for entry in os.scandir(".")}
+
     for model_file in model_files:
-        if Path(model_file).exists():
-            # Move to models directory
-            Path(model_file).rename(models_dir / model_file)
+        if model_file in present:
+            # os.replace moves in a single syscall and overwrites any
+            # stale copy already in the models directory
+            os.replace(model_file, models_dir / model_file)
             print(f"📁 Moved {model_file} to models directory")
 
 def main():
@@ -3,6 +3,7 @@ Setup script for the Earthquake Impact Predictor
 This script will help you get everything up and running
 """
 
+import hashlib
 import subprocess
 import sys
 import os
@@ -11,8 +12,25 @@ from pathlib import Path
 def install_requirements():
     """Install required packages"""
     print("📦 Installing required packages...")
+
+    # Skip the pip run entirely when requirements.txt hasn't changed
+    # since the last successful install
+    marker = Path(".requirements_installed")
+    digest = hashlib.sha256(Path("requirements.txt").read_bytes()).hexdigest()
+    if marker.exists() and marker.read_text().strip() == digest:
+        print("⚡ Requirements unchanged since last install - skipping")
+        return True
+
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # close_fds=False lets CPython launch via posix_spawn instead of
+        # fork+exec; this script opens no sensitive descriptors to leak
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install",
+             "--prefer-binary", "--no-compile",
+             "-r", "requirements.txt"],
+            close_fds=False
+        )
+        marker.write_text(digest)
         print("✅ All packages installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -23,7 +41,7 @@ def setup_models():
     """Setup models by running extract_models.py"""
     print("\n🤖 Setting up machine learning models...")
     try:
-        subprocess.check_call([sys.executable, "extract_models.py"])
+        subprocess.check_call([sys.executable, "extract_models.py"], close_fds=False)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Error setting up models: {e}")
@@ -1,12 +1,19 @@
 import requests
 import json
+from http_client import make_session, json_of
+
+# One pooled session (HTTP/2 via TEST_HTTP2=1): keep-alive reuses the
+# TCP connection across repeated runs of this script in one process
+session = make_session()
+
+PREDICT_URL = "http://localhost:5000/predict"
 
 print("🧪 Simple API Test")
 
 try:
     # Test the prediction endpoint
-    response = requests.post(
-        "http://localhost:5000/predict",
+    response = session.post(
+        PREDICT_URL,
         json={
             "magnitude": 6.5,
             "depth": 15,
@@ -15,25 +22,25 @@ try:
         },
         headers={'Content-Type': 'application/json'}
     )
-    
+
     print(f"Status: {response.status_code}")
-    
+
     if response.status_code == 200:
-        result = response.json()
+        result = json_of(response)
         print("Success:", result.get('success'))
-        
+
         if result.get('success'):
             predictions = result.get('predictions', {})
             print("\nPredictions:")
-            
+
             if 'high_impact' in predictions:
                 hi = predictions['high_impact']
                 print(f"  High Impact: {hi['probability']:.2%} ({hi['risk_level']})")
-            
+
             if 'tsunami' in predictions:
                 ts = predictions['tsunami']
                 print(f"  Tsunami: {ts['probability']:.2%} ({ts['risk_level']})")
-                
+
             print("\n✅ API is working correctly!")
         else:
             print("❌ Prediction failed:", result.get('error'))
@@ -41,4 +48,4 @@ try:
         print("❌ HTTP Error:", response.text)
 
 except Exception as e:
-    print(f"❌ Error: {e}")
\ No newline at end of file
+    print(f"❌ Error: {e}")
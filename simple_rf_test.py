@@ -2,8 +2,21 @@
 Simple test for Random Forest earthquake prediction
 """
 
+import os
 import requests
 import json
+from http_client import make_session, json_of, json_bytes
+
+# Set TEST_VERBOSE=1 to dump response bodies on error paths
+VERBOSE = os.environ.get("TEST_VERBOSE") == "1"
+
+# One pooled session (HTTP/2 via TEST_HTTP2=1): keep-alive reuses the
+# TCP connection across all calls
+session = make_session()
+
+# Endpoint URL built once at import instead of per call
+BASE_URL = "http://localhost:5000"
+PREDICT_URL = BASE_URL + "/predict"
 
 def test_prediction_endpoint():
     print("🧪 Testing Random Forest Prediction Endpoint")
@@ -28,10 +41,12 @@ def test_prediction_endpoint():
             print(f"   {key}: {value}")
         
         print("\\n🔄 Making prediction request...")
-        
-        response = requests.post(
-            "http://localhost:5000/predict",
-            json=test_earthquake,
+
+        # Encode once and post the bytes directly
+        payload = json_bytes(test_earthquake)
+        response = session.post(
+            PREDICT_URL,
+            data=payload,
             headers={'Content-Type': 'application/json'},
             timeout=10
         )
@@ -39,7 +54,7 @@ def test_prediction_endpoint():
         print(f"📡 Response Status: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = json_of(response)
             
             if result.get('success'):
                 print("✅ Prediction successful!")
@@ -71,7 +86,8 @@ def test_prediction_endpoint():
                 print(f"❌ Prediction failed: {result.get('error', 'Unknown error')}")
         else:
             print(f"❌ HTTP Error: {response.status_code}")
-            print(f"Response: {response.text}")
+            if VERBOSE:
+                print(f"Response: {response.text[:200]}...")
             
     except Exception as e:
         print(f"❌ Test failed: {e}")
@@ -1,14 +1,23 @@
 import requests
 import json
+from http_client import make_session, json_of
+
+# One pooled session (HTTP/2 via TEST_HTTP2=1): keep-alive reuses the
+# TCP connection across both calls
+session = make_session()
+
+# Endpoint URLs built once at import instead of per call
+BASE_URL = "http://localhost:5000"
+PREDICT_URL = BASE_URL + "/predict"
 
 print("🧪 Testing Fixed Application")
 print("=" * 30)
 
 try:
     # Test basic connectivity
-    response = requests.get("http://localhost:5000", timeout=5)
+    response = session.get(BASE_URL, timeout=5)
     print(f"✅ Server Status: {response.status_code}")
-    
+
     # Test prediction endpoint
     test_data = {
         "magnitude": 6.5,
@@ -17,21 +26,21 @@ try:
         "longitude": 139.0,
         "alert": "yellow"
     }
-    
+
     print("📡 Testing prediction...")
-    response = requests.post(
-        "http://localhost:5000/predict",
+    response = session.post(
+        PREDICT_URL,
         json=test_data,
         headers={'Content-Type': 'application/json'},
         timeout=5
     )
-    
+
     print(f"📨 Response Status: {response.status_code}")
-    
+
     if response.status_code == 200:
-        result = response.json()
+        result = json_of(response)
         print(f"✅ Success: {result['success']}")
-        
+
         if result['success']:
             predictions = result['predictions']
             print(f"📊 High Impact: {predictions['high_impact']['probability']:.1%} ({predictions['high_impact']['risk_level']})")
@@ -46,4 +55,4 @@ try:
 except Exception as e:
     print(f"❌ Error: {e}")
 
-print("\n🌐 Open http://localhost:5000 in your browser to test the UI")
\ No newline at end of file
+print("\n🌐 Open http://localhost:5000 in your browser to test the UI")
@@ -0,0 +1,119 @@
+"""
+Parameterized /predict tests covering every scenario from the standalone scripts
+
+Run with pytest to fan the scenarios out across worker processes:
+
+    pip install pytest pytest-xdist   # not in requirements.txt
+    pytest test_predict.py -n auto
+
+Each xdist worker gets its own pooled session, so scenarios run in true
+parallel processes instead of one sequential loop per script. The module
+also runs standalone (python test_predict.py) in the usual print style,
+which is the only mode that works without pytest installed.
+"""
+
+try:
+    import pytest
+except ImportError:
+    # Standalone mode needs only the shared client; the fixture and
+    # parameterized test below are defined only under pytest
+    pytest = None
+
+from http_client import make_session, call_predict
+
+BASE_URL = "http://localhost:5000"
+PREDICT_URL = BASE_URL + "/predict"
+
+# Every scenario from test_earthquake_rf.py, test_no_coordinates.py and
+# test_final_system.py, tagged with the behaviour it exercises
+ALL_SCENARIOS = [
+    {
+        "name": "Moderate Earthquake",
+        "data": {"magnitude": 6.5, "depth": 15, "latitude": 35.0, "longitude": 139.0,
+                 "cdi": 5, "mmi": 4, "sig": 600, "magType": "mw", "alert": "green"},
+        "expected": "Medium risk earthquake",
+    },
+    {
+        "name": "Strong Shallow Earthquake",
+        "data": {"magnitude": 7.2, "depth": 8, "latitude": -33.0, "longitude": -72.0,
+                 "cdi": 7, "mmi": 6, "sig": 850, "magType": "mw", "alert": "yellow"},
+        "expected": "High impact due to shallow depth and high magnitude",
+    },
+    {
+        "name": "Major Deep Earthquake",
+        "data": {"magnitude": 8.1, "depth": 150, "latitude": 40.0, "longitude": 25.0,
+                 "cdi": 6, "mmi": 5, "sig": 1200, "magType": "mw", "alert": "red"},
+        "expected": "High magnitude but deep, mixed impact",
+    },
+    {
+        "name": "Tsunami-prone Earthquake",
+        "data": {"magnitude": 7.8, "depth": 25, "latitude": 38.0, "longitude": 142.0,
+                 "cdi": 8, "mmi": 7, "sig": 1000, "magType": "mw", "alert": "orange"},
+        "expected": "High tsunami risk due to magnitude and moderate depth",
+    },
+    {
+        "name": "Small earthquake in Japan (no coordinates)",
+        "data": {"magnitude": 4.2, "depth": 25, "alert": "none",
+                 "country": "Japan", "continent": "Asia", "magType": "ml"},
+        "expected": "Works without latitude/longitude",
+    },
+    {
+        "name": "Medium earthquake in Chile (no coordinates)",
+        "data": {"magnitude": 6.5, "depth": 15, "alert": "yellow",
+                 "country": "Chile", "continent": "South America", "magType": "mw"},
+        "expected": "Works without latitude/longitude",
+    },
+    {
+        "name": "Large earthquake in Indonesia (no coordinates)",
+        "data": {"magnitude": 7.8, "depth": 8, "alert": "red",
+                 "country": "Indonesia", "continent": "Asia", "magType": "mw"},
+        "expected": "Works without latitude/longitude",
+    },
+    {
+        "name": "Earthquake without country",
+        "data": {"magnitude": 5.5, "depth": 30, "alert": "green", "magType": "mb"},
+        "expected": "Works with minimal fields",
+    },
+    {
+        "name": "Final-system reference earthquake",
+        "data": {"magnitude": 7.2, "depth": 15, "alert": "orange", "magType": "mw",
+                 "cdi": 7, "mmi": 6, "sig": 850, "country": "Japan", "continent": "Asia"},
+        "expected": "High impact prediction",
+    },
+]
+
+
+if pytest is not None:
+
+    @pytest.fixture(scope="session")
+    def session():
+        """One pooled session per worker process"""
+        return make_session()
+
+    @pytest.mark.parametrize("scenario", ALL_SCENARIOS, ids=lambda s: s["name"])
+    def test_predict_scenario(session, scenario):
+        predictions = call_predict(session, PREDICT_URL, scenario["data"])
+
+        for pred in predictions.values():
+            assert 0.0 <= pred["probability"] <= 1.0
+            assert pred["risk_level"] in ("Low", "Medium", "High")
+
+        # The sanity checks the standalone scripts print as warnings
+        magnitude = scenario["data"]["magnitude"]
+        depth = scenario["data"]["depth"]
+        if magnitude >= 7.5 and "high_impact" in predictions:
+            assert predictions["high_impact"]["probability"] > 0.3, scenario["expected"]
+        if magnitude >= 7.0 and depth <= 50 and "tsunami_risk" in predictions:
+            assert predictions["tsunami_risk"]["probability"] > 0.1, scenario["expected"]
+
+
+if __name__ == "__main__":
+    # Plain sequential fallback when pytest is not available
+    client = make_session()
+    print("🧪 Running all /predict scenarios")
+    for scenario in ALL_SCENARIOS:
+        try:
+            call_predict(client, PREDICT_URL, scenario["data"])
+            print(f"   ✅ {scenario['name']}")
+        except Exception as e:
+            print(f"   ❌ {scenario['name']}: {e}")